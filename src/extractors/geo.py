@@ -0,0 +1,102 @@
+import csv
+import logging
+import os
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+logger = logging.getLogger("extractors.geo")
+
+DEFAULT_CITIES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir,
+    "config",
+    "us_cities.csv",
+)
+
+def iter_cities(
+    cities_path: Optional[str] = None,
+    *,
+    states: Optional[Set[str]] = None,
+    min_population: int = 0,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read the bundled city/state table, yielding matching rows.
+    Each row looks like {'city': 'Austin', 'state': 'TX', 'population': 961855}.
+    """
+    path = cities_path or DEFAULT_CITIES_PATH
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            state = (row.get("state") or "").strip().upper()
+            if states and state not in states:
+                continue
+            try:
+                population = int(row.get("population") or 0)
+            except ValueError:
+                logger.warning("Skipping city row with invalid population: %s", row)
+                continue
+            if population < min_population:
+                continue
+            yield {
+                "city": (row.get("city") or "").strip(),
+                "state": state,
+                "population": population,
+            }
+
+def _as_str_list(spec: Dict[str, Any], plural: str, singular: str) -> List[str]:
+    value = spec.get(plural, spec.get(singular))
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"'{plural}' must be a string or a list of strings.")
+    return [v.strip() for v in value if v.strip()]
+
+def expand_search_spec(
+    spec: Dict[str, Any],
+    cities_path: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Expand a compact spec into a stream of search definitions.
+    Example spec:
+        {"keywords": ["Plumbers"], "states": ["TX"], "min_population": 50000, "pages": 2}
+    yields {'keyword': 'Plumbers', 'location': 'Houston, TX', 'pages': 2}, ...
+    The spec, cities file and state codes are validated eagerly; searches are
+    only generated as the stream is consumed.
+    """
+    keywords = _as_str_list(spec, "keywords", "keyword")
+    if not keywords:
+        raise ValueError("Expansion spec requires at least one keyword.")
+    states = {s.upper() for s in _as_str_list(spec, "states", "state")} or None
+    min_population = int(spec.get("min_population", 0))
+    pages = int(spec.get("pages", 1))
+    path = spec.get("cities_file") or cities_path or DEFAULT_CITIES_PATH
+    if not os.path.isfile(path):
+        raise ValueError(f"Cities file {path} not found.")
+    if states:
+        known_states = {city["state"] for city in iter_cities(path)}
+        unknown = sorted(states - known_states)
+        if unknown:
+            raise ValueError(
+                f"Unknown state code(s) {unknown}; use two-letter codes such as 'TX'."
+            )
+
+    return _generate(keywords, path, states, min_population, pages)
+
+def _generate(
+    keywords: List[str],
+    cities_path: Optional[str],
+    states: Optional[Set[str]],
+    min_population: int,
+    pages: int,
+) -> Iterator[Dict[str, Any]]:
+    count = 0
+    for city in iter_cities(cities_path, states=states, min_population=min_population):
+        location = f"{city['city']}, {city['state']}"
+        for keyword in keywords:
+            count += 1
+            yield {"keyword": keyword, "location": location, "pages": pages}
+    logger.info(
+        "Expansion of %d keyword(s) produced %d search definitions.",
+        len(keywords),
+        count,
+    )
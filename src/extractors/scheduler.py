@@ -0,0 +1,122 @@
+import itertools
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger("extractors.scheduler")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+class TaskSourceError(Exception):
+    """
+    Raised by WorkStealingScheduler.run when the task source fails partway.
+    `results` holds everything the workers finished before the run stopped.
+    """
+
+    def __init__(self, message: str, results: List[Any]) -> None:
+        super().__init__(message)
+        self.results = results
+
+class WorkStealingScheduler:
+    """
+    Run tasks from a (possibly lazy) iterable across worker threads.
+
+    Each worker owns a deque which it refills in small chunks from the shared
+    source and consumes from the head, in source order. When its deque is
+    empty and the source is drained, a worker steals from the tail of another
+    worker's deque, so a few slow, many-page searches at the end of a run
+    don't leave the other workers idle while work is still queued behind them.
+    """
+
+    def __init__(self, *, workers: int = 4, chunk_size: int = 4) -> None:
+        self.workers = max(1, int(workers))
+        self.chunk_size = max(1, int(chunk_size))
+
+    def run(self, tasks: Iterable[T], handler: Callable[[T], R]) -> List[R]:
+        """
+        Call handler(task) for every task and return the results in completion order.
+        Tasks whose handler raises are logged and skipped. If the source itself
+        raises, the tasks already taken from it still run, then TaskSourceError
+        is raised with the partial results (the original error as its cause).
+        """
+        source: Iterator[T] = iter(tasks)
+        source_lock = threading.Lock()
+        source_state: Dict[str, Any] = {"exhausted": False, "error": None}
+        # deque append/pop/popleft are atomic, so the queues need no locks of their own.
+        queues: List[Deque[T]] = [deque() for _ in range(self.workers)]
+        results: List[R] = []
+        results_lock = threading.Lock()
+
+        def refill(index: int) -> bool:
+            # Items are moved into the worker's deque while the source lock is
+            # held, so a worker that sees the source exhausted also sees them.
+            with source_lock:
+                if source_state["exhausted"]:
+                    return False
+                chunk: List[T] = []
+                try:
+                    chunk.extend(itertools.islice(source, self.chunk_size))
+                except Exception as exc:  # noqa: BLE001
+                    logger.error("Task source failed: %s", exc)
+                    source_state["error"] = exc
+                    source_state["exhausted"] = True
+                if not chunk:
+                    source_state["exhausted"] = True
+                    return False
+                queues[index].extend(chunk)
+                return True
+
+        def steal(index: int) -> Optional[Tuple[T]]:
+            for offset in range(1, self.workers):
+                victim = queues[(index + offset) % self.workers]
+                try:
+                    return (victim.pop(),)
+                except IndexError:
+                    continue
+            return None
+
+        def next_task(index: int) -> Optional[Tuple[T]]:
+            while True:
+                try:
+                    return (queues[index].popleft(),)
+                except IndexError:
+                    pass
+                if refill(index):
+                    continue
+                stolen = steal(index)
+                if stolen is not None:
+                    logger.debug("Worker %d stole a task.", index)
+                return stolen
+
+        def worker(index: int) -> None:
+            while True:
+                item = next_task(index)
+                if item is None:
+                    return
+                task = item[0]
+                try:
+                    result = handler(task)
+                except Exception as exc:  # noqa: BLE001
+                    logger.error("Task %r failed: %s", task, exc, exc_info=True)
+                    continue
+                with results_lock:
+                    results.append(result)
+
+        if self.workers == 1:
+            worker(0)
+        else:
+            threads = [
+                threading.Thread(target=worker, args=(i,), name=f"yp-worker-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        error = source_state["error"]
+        if error is not None:
+            raise TaskSourceError(f"Task source failed: {error}", results) from error
+        return results
@@ -3,8 +3,11 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from extractors.geo import expand_search_spec
+from extractors.scheduler import TaskSourceError, WorkStealingScheduler
 from extractors.yellowpages_parser import YellowPagesScraper
 from outputs import exporters
 
@@ -32,6 +35,8 @@ def load_settings(settings_path: Optional[str]) -> Dict[str, Any]:
         "proxies": None,
         "timeout_seconds": 20,
         "output_directory": "data",
+        "workers": 1,
+        "cities_file": None,
     }
 
     if not settings_path:
@@ -57,9 +62,14 @@ def load_settings(settings_path: Optional[str]) -> Dict[str, Any]:
 
     return defaults
 
-def load_batch_inputs(input_path: str) -> List[Dict[str, Any]]:
+def load_batch_inputs(
+    input_path: str,
+    cities_path: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
     """
-    Load a batch configuration JSON with a top-level 'searches' array.
+    Load a batch configuration JSON with a top-level 'searches' array and/or
+    an 'expansions' array of keyword x city specs (see extractors.geo).
+    Returns a lazy stream: explicit searches first, then expanded ones.
     """
     try:
         with open(input_path, "r", encoding="utf-8") as f:
@@ -67,8 +77,24 @@ def load_batch_inputs(input_path: str) -> List[Dict[str, Any]]:
         searches = data.get("searches", [])
         if not isinstance(searches, list):
             raise ValueError("'searches' must be a list.")
-        logger.info("Loaded %d search definitions from %s", len(searches), input_path)
-        return searches
+        expansions = data.get("expansions", [])
+        if not isinstance(expansions, list):
+            raise ValueError("'expansions' must be a list.")
+        # A relative cities_file in a spec is relative to the input config itself.
+        config_dir = os.path.dirname(os.path.abspath(input_path))
+        expanded = []
+        for spec in expansions:
+            cities_file = spec.get("cities_file") if isinstance(spec, dict) else None
+            if cities_file and not os.path.isabs(cities_file):
+                spec = {**spec, "cities_file": os.path.join(config_dir, cities_file)}
+            expanded.append(expand_search_spec(spec, cities_path))
+        logger.info(
+            "Loaded %d search definitions and %d expansion specs from %s",
+            len(searches),
+            len(expansions),
+            input_path,
+        )
+        return chain(searches, *expanded)
     except FileNotFoundError:
         logger.error("Input config file %s not found.", input_path)
         raise
@@ -84,6 +110,21 @@ def ensure_output_dir(path: str) -> None:
     if directory and not os.path.exists(directory):
         os.makedirs(directory, exist_ok=True)
 
+def resolve_workers(value: Any) -> int:
+    """
+    Coerce a worker count from CLI/settings to a positive int.
+    Falls back to 1 worker if the value is missing or invalid.
+    """
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        logger.warning("Invalid workers value %r, using 1 worker.", value)
+        return 1
+    if workers < 1:
+        logger.warning("Workers must be at least 1 (got %d), using 1 worker.", workers)
+        return 1
+    return workers
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Real Yellow Pages Lead Generator (USA version)",
@@ -108,6 +149,16 @@ def parse_args() -> argparse.Namespace:
         help="Path to JSON file describing multiple searches (see data/inputs.sample.json).",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=(
+            "Number of concurrent workers for batch mode "
+            "(default: 'workers' from settings, or 1). The request delay applies "
+            "per worker, so N workers send roughly N times as many requests."
+        ),
+    )
+
     # Settings
     parser.add_argument(
         "--settings",
@@ -160,10 +211,15 @@ def run_single(
 
 def run_batch(
     scraper: YellowPagesScraper,
-    batch_definitions: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
-    all_leads: List[Dict[str, Any]] = []
-    for idx, definition in enumerate(batch_definitions, start=1):
+    batch_definitions: Iterator[Dict[str, Any]],
+    workers: int = 1,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Run batch searches and return (leads, complete). If the search stream
+    fails partway, the leads collected so far are kept and complete is False.
+    """
+    def run_definition(item: Any) -> Tuple[int, List[Dict[str, Any]]]:
+        idx, definition = item
         keyword = definition.get("keyword")
         location = definition.get("location")
         pages = int(definition.get("pages", 1))
@@ -174,12 +230,11 @@ def run_batch(
                 idx,
                 definition,
             )
-            continue
+            return idx, []
 
         logger.info(
-            "Batch search %d/%d: keyword=%r, location=%r, pages=%d",
+            "Batch search %d: keyword=%r, location=%r, pages=%d",
             idx,
-            len(batch_definitions),
             keyword,
             location,
             pages,
@@ -189,9 +244,22 @@ def run_batch(
         for lead in leads:
             lead.setdefault("_search_keyword", keyword)
             lead.setdefault("_search_location", location)
-        all_leads.extend(leads)
-        logger.info("Total leads accumulated so far: %d", len(all_leads))
-    return all_leads
+        logger.info("Batch search %d collected %d leads.", idx, len(leads))
+        return idx, leads
+
+    scheduler = WorkStealingScheduler(workers=workers)
+    complete = True
+    try:
+        results = scheduler.run(enumerate(batch_definitions, start=1), run_definition)
+    except TaskSourceError as exc:
+        logger.error("Batch stopped early, keeping partial results: %s", exc)
+        results = exc.results
+        complete = False
+    # Workers finish in any order; keep the export in input order.
+    results.sort(key=lambda result: result[0])
+    all_leads: List[Dict[str, Any]] = [lead for _, leads in results for lead in leads]
+    logger.info("Total leads collected in batch: %d", len(all_leads))
+    return all_leads, complete
 
 def main() -> None:
     args = parse_args()
@@ -217,9 +285,16 @@ def main() -> None:
         base_output_path = build_default_output_path(output_dir, "json")
 
     # Collect leads
+    complete = True
     if args.input_config:
-        batch_definitions = load_batch_inputs(args.input_config)
-        leads = run_batch(scraper, batch_definitions)
+        batch_definitions = load_batch_inputs(
+            args.input_config,
+            cities_path=settings.get("cities_file"),
+        )
+        workers = resolve_workers(
+            args.workers if args.workers is not None else settings.get("workers", 1)
+        )
+        leads, complete = run_batch(scraper, batch_definitions, workers=workers)
         suffix = "batch"
     else:
         if not args.keyword or not args.location:
@@ -238,6 +313,8 @@ def main() -> None:
 
     if not leads:
         logger.warning("No leads were collected; nothing to export.")
+        if not complete:
+            raise SystemExit(1)
         return
 
     # Decide actual output paths and export
@@ -267,5 +344,9 @@ def main() -> None:
     for path in exported_paths:
         logger.info("Exported %d leads to %s", len(leads), path)
 
+    if not complete:
+        logger.error("Batch did not finish; exported leads are partial.")
+        raise SystemExit(1)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules are imported the way src/main.py imports them (e.g. extractors.scheduler).
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
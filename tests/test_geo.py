@@ -0,0 +1,70 @@
+import pytest
+
+from extractors.geo import DEFAULT_CITIES_PATH, expand_search_spec, iter_cities
+
+CITIES_CSV = """city,state,population
+Houston,TX,2304580
+Austin,TX,961855
+Waco,TX,138486
+Phoenix,AZ,1608139
+Flagstaff,AZ,76831
+"""
+
+@pytest.fixture
+def cities_file(tmp_path):
+    path = tmp_path / "cities.csv"
+    path.write_text(CITIES_CSV, encoding="utf-8")
+    return str(path)
+
+def test_iter_cities_filters_by_state_and_population(cities_file):
+    cities = list(iter_cities(cities_file, states={"TX"}, min_population=500000))
+    assert cities == [
+        {"city": "Houston", "state": "TX", "population": 2304580},
+        {"city": "Austin", "state": "TX", "population": 961855},
+    ]
+
+def test_expand_yields_keyword_by_city(cities_file):
+    spec = {"keywords": ["Plumbers", "HVAC"], "states": ["az"], "pages": 2}
+    assert list(expand_search_spec(spec, cities_file)) == [
+        {"keyword": "Plumbers", "location": "Phoenix, AZ", "pages": 2},
+        {"keyword": "HVAC", "location": "Phoenix, AZ", "pages": 2},
+        {"keyword": "Plumbers", "location": "Flagstaff, AZ", "pages": 2},
+        {"keyword": "HVAC", "location": "Flagstaff, AZ", "pages": 2},
+    ]
+
+def test_expand_min_population_across_all_states(cities_file):
+    spec = {"keyword": "Dentists", "min_population": 1000000}
+    locations = [d["location"] for d in expand_search_spec(spec, cities_file)]
+    assert locations == ["Houston, TX", "Phoenix, AZ"]
+
+def test_spec_cities_file_overrides_default_path(cities_file):
+    spec = {"keyword": "Dentists", "cities_file": cities_file, "states": ["TX"]}
+    assert len(list(expand_search_spec(spec, DEFAULT_CITIES_PATH))) == 3
+
+def test_expand_is_lazy(cities_file):
+    stream = expand_search_spec({"keyword": "Dentists"}, cities_file)
+    # The table is only read once the stream is consumed.
+    with open(cities_file, "w", encoding="utf-8") as f:
+        f.write("city,state,population\nTucson,AZ,542629\n")
+    assert [d["location"] for d in stream] == ["Tucson, AZ"]
+
+def test_bundled_table_covers_large_texas_cities():
+    locations = {
+        d["location"]
+        for d in expand_search_spec({"keyword": "x", "states": ["TX"], "min_population": 1000000})
+    }
+    assert locations == {"Houston, TX", "San Antonio, TX", "Dallas, TX"}
+
+@pytest.mark.parametrize(
+    "spec, message",
+    [
+        ({"states": ["TX"]}, "at least one keyword"),
+        ({"keywords": []}, "at least one keyword"),
+        ({"keywords": "Plumbers", "states": ["Texas"]}, "Unknown state"),
+        ({"keywords": ["Plumbers", 3]}, "'keywords' must be"),
+        ({"keyword": "Plumbers", "states": "TX", "cities_file": "missing.csv"}, "not found"),
+    ],
+)
+def test_invalid_specs_raise_value_error(cities_file, spec, message):
+    with pytest.raises(ValueError, match=message):
+        expand_search_spec(spec, cities_file)
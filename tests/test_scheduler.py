@@ -0,0 +1,75 @@
+import threading
+from collections import Counter
+
+import pytest
+
+from extractors.scheduler import TaskSourceError, WorkStealingScheduler
+
+def test_single_worker_runs_tasks_in_source_order():
+    scheduler = WorkStealingScheduler(workers=1, chunk_size=4)
+    assert scheduler.run(range(1, 11), lambda task: task) == list(range(1, 11))
+
+def test_every_task_runs_exactly_once_with_many_workers():
+    seen = Counter()
+    lock = threading.Lock()
+
+    def handler(task):
+        with lock:
+            seen[task] += 1
+        return task
+
+    scheduler = WorkStealingScheduler(workers=4, chunk_size=3)
+    results = scheduler.run(iter(range(200)), handler)
+
+    assert sorted(results) == list(range(200))
+    assert seen == Counter(range(200))
+
+def test_idle_worker_steals_behind_a_slow_task():
+    # One chunk holds every task, so only stealing lets the second worker help.
+    other_task_done = threading.Event()
+    threads = {}
+
+    def handler(task):
+        if task == 0:
+            assert other_task_done.wait(timeout=5), "no task was stolen"
+        else:
+            other_task_done.set()
+        threads[task] = threading.current_thread().name
+        return task
+
+    scheduler = WorkStealingScheduler(workers=2, chunk_size=10)
+    results = scheduler.run(range(6), handler)
+
+    assert sorted(results) == list(range(6))
+    assert threads[0] != threads[5]
+
+def test_failing_handler_is_skipped():
+    def handler(task):
+        if task == 2:
+            raise RuntimeError("boom")
+        return task
+
+    scheduler = WorkStealingScheduler(workers=1)
+    assert scheduler.run(range(4), handler) == [0, 1, 3]
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_failing_source_raises_with_partial_results(workers):
+    def source():
+        yield 1
+        yield 2
+        raise OSError("cities file vanished")
+
+    seen = []
+    lock = threading.Lock()
+
+    def handler(task):
+        with lock:
+            seen.append(task)
+        return task
+
+    scheduler = WorkStealingScheduler(workers=workers, chunk_size=4)
+    with pytest.raises(TaskSourceError, match="cities file vanished") as excinfo:
+        scheduler.run(source(), handler)
+    assert sorted(seen) == [1, 2]
+    assert sorted(excinfo.value.results) == [1, 2]
+    assert isinstance(excinfo.value.__cause__, OSError)